@@ -37,6 +37,10 @@ class UserEnv(object):
     USER_ID = "USER_ID"
 
 
+class MasterEnv(object):
+    NODE_EVENT_WORKERS = "DLROVER_EVENT_WORKERS"
+
+
 class TaskType(object):
     TRAINING = "training"
     EVALUATION = "evaluation"
@@ -14,7 +14,7 @@
 import os
 import threading
 
-from dlrover.python.common.constants import UserEnv
+from dlrover.python.common.constants import MasterEnv, UserEnv
 from dlrover.python.common.grpc import find_free_port_in_range
 from dlrover.python.common.log import default_logger as logger
 
@@ -51,6 +51,7 @@ class DefaultValues(object):
     SEC_TO_CHANGE_PS = 3600  # 1h
     SEC_TO_WAIT_FAILED_PS = 600  # 10min
     HANG_CPU_USAGE_RATE = 0.05
+    NODE_EVENT_WORKERS = 8
 
 
 class Context(object):
@@ -94,6 +95,11 @@ class Context(object):
         self.is_tfv1_ps = False
         self.master_port = 0
         self.relaunch_always = False
+        self.node_event_workers = int(
+            os.getenv(
+                MasterEnv.NODE_EVENT_WORKERS, DefaultValues.NODE_EVENT_WORKERS
+            )
+        )
 
     def set_params_from_brain(self):
         self.train_speed_record_num = self.get_param_value_from_brain(
@@ -165,8 +165,38 @@ class Node(object):
         init_time: the timestamp to initialize the node object.
         host_name: the name of the host where the node is placed.
         host_ip: the ip of host node.
+        update_time: the timestamp to receive the node from the platform.
     """
 
+    __slots__ = (
+        "type",
+        "id",
+        "name",
+        "status",
+        "start_time",
+        "rank_index",
+        "relaunch_count",
+        "critical",
+        "max_relaunch_count",
+        "relaunchable",
+        "service_addr",
+        "create_time",
+        "finish_time",
+        "is_recovered_oom",
+        "is_released",
+        "exit_reason",
+        "config_resource",
+        "used_resource",
+        "start_hang_time",
+        "init_time",
+        "eval_time",
+        "host_name",
+        "host_ip",
+        "hang",
+        "paral_config",
+        "update_time",
+    )
+
     def __init__(
         self,
         node_type,
@@ -210,6 +240,7 @@ class Node(object):
         self.host_ip = host_ip
         self.hang = False
         self.paral_config = ParallelConfig()
+        self.update_time = 0.0
 
     def inc_relaunch_count(self):
         self.relaunch_count += 1
@@ -259,6 +290,7 @@ class Node(object):
         new_node.is_released = False
         new_node.relaunchable = True
         new_node.init_time = time.time()
+        new_node.update_time = 0.0
         return new_node
 
     def is_unrecoverable_failure(self):
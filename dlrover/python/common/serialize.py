@@ -17,6 +17,8 @@ import json
 def to_dict(o):
     if hasattr(o, "__dict__"):
         return o.__dict__
+    elif hasattr(o, "__slots__"):
+        return {key: getattr(o, key) for key in o.__slots__ if hasattr(o, key)}
     else:
         return {}
 
@@ -12,12 +12,18 @@
 # limitations under the License.
 
 import copy
+import itertools
+import logging
 import os
+import random
 import threading
 import time
 import traceback
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple
 
 from dlrover.python.common.constants import (
     DistributionStrategy,
@@ -83,6 +89,31 @@ _dlrover_context = Context.singleton_instance()
 
 _MAX_POD_RELAUNCH_COUNT = 5
 
+_NODE_LOCK_STRIPES = 64
+
+_MIN_WATCH_BACKOFF_SECS = 0.1
+_MAX_WATCH_BACKOFF_SECS = 30
+
+_ALIVE_NODE_STATUS = frozenset(
+    [NodeStatus.INITIAL, NodeStatus.PENDING, NodeStatus.RUNNING]
+)
+
+_EXITED_NODE_STATUS = frozenset([NodeStatus.SUCCEEDED, NodeStatus.FAILED])
+
+# The callback method to call when a node changes to the status.
+_NODE_EVENT_CALLBACK_NAMES = {
+    NodeStatus.RUNNING: "on_node_started",
+    NodeStatus.SUCCEEDED: "on_node_succeeded",
+    NodeStatus.FAILED: "on_node_failed",
+    NodeStatus.DELETED: "on_node_deleted",
+}
+
+_MAX_BUFFERED_NODE_LOGS = 4096
+_NODE_LOG_FLUSH_INTERVAL = 0.1
+
+_MAX_WATCH_EVENT_LAG_SECS = 10
+_WATCH_EVENT_LAG_REPORT_INTERVAL = 60
+
 
 class DistributedJobManager(JobManager):
     """DistributedJobManager manages the nodes of a distributed job on
@@ -102,6 +133,7 @@ class DistributedJobManager(JobManager):
         node_watcher=None,
         job_scaler=None,
         error_monitor=None,
+        stop_event=None,
     ):
         self._job_resource = JobResource()
         node_restart_count: Dict[str, int] = {}
@@ -155,14 +187,61 @@ class DistributedJobManager(JobManager):
         self._ps_relaunch_max_num = min(
             ps_restart_count, _MAX_POD_RELAUNCH_COUNT
         )
-        self._node_event_callbacks: List[NodeEventCallback] = []
+        # The bound methods of the node event callbacks to call for each
+        # node status.
+        self._node_event_handlers: Dict[str, List[Callable]] = {
+            status: [] for status in _NODE_EVENT_CALLBACK_NAMES
+        }
+        self._cluster_context = ClusterContext(job_manager=self)
         self._stop_monitor = False
+        # Shared with the node watcher to return from a blocking watch.
+        self._stop_event: threading.Event = stop_event or threading.Event()
         self._speed_monitor: SpeedMonitor = speed_monitor
         self._error_monitor: ErrorMonitor = error_monitor
 
-        # Protects followed variables, which are accessed from event_cb.
+        # Protects the status of nodes, which are accessed from event_cb.
+        # The status transitions of different nodes run concurrently and
+        # the events of the same node are serialized by its lock stripe.
+        self._node_locks = [
+            threading.Lock() for _ in range(_NODE_LOCK_STRIPES)
+        ]
+        # Serializes the node event callbacks and relaunch decisions, which
+        # change the state shared by all nodes like the services of the
+        # master, the job optimizer and the pending relaunch counter.
         self._lock = threading.Lock()
+        # Serializes relaunching nodes from the event executors, which adds
+        # nodes into the shared node dicts and scales the job.
+        self._relaunch_lock = threading.Lock()
         self._job_nodes: Dict[str, Dict[int, Node]] = {}
+        # A flat list of all nodes in the job to scan without traversing
+        # the nested dicts. It is invalidated if the managers add nodes.
+        self._all_nodes: Optional[List[Node]] = None
+        self._all_nodes_lock = threading.Lock()
+
+        # The latest observed nodes on the cluster keyed by (type, id),
+        # which is seeded by the planned nodes and kept current by watched
+        # events. Nodes are only listed if the watcher has no valid
+        # resource version to watch from.
+        self._pod_cache: Dict[Tuple[str, int], Node] = {}
+        self._last_resource_version = None
+        # The summary of the seconds from watching node events to
+        # processing them, which is logged and reset periodically.
+        self._watch_event_lag_lock = threading.Lock()
+        self._watch_event_count = 0
+        self._watch_event_lag_sum = 0.0
+        self._max_watch_event_lag = 0.0
+
+        # The info logs of node events are buffered and flushed as one
+        # record periodically to reduce writes under event storms. A full
+        # buffer is flushed at once instead of dropping logs.
+        self._node_logs: Deque[Tuple[str, tuple]] = deque()
+        # Watched events are processed in parallel. The events of a node
+        # are always dispatched to the same single-thread executor to
+        # keep their order.
+        self._event_executors = [
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="node_event")
+            for _ in range(max(_dlrover_context.node_event_workers, 1))
+        ]
 
         self._elastic_job: ElasticJob = job
         self._node_watcher = node_watcher
@@ -193,6 +272,11 @@ class DistributedJobManager(JobManager):
         threading.Thread(
             target=self._monitor_nodes, name="node_monitor", daemon=True
         ).start()
+        threading.Thread(
+            target=self._flush_node_logs_periodically,
+            name="node_log_flusher",
+            daemon=True,
+        ).start()
         if os.getenv("KUBERNETES_SERVICE_HOST"):
             threading.Thread(
                 target=self._monitor_scale_plan_crd,
@@ -255,9 +339,20 @@ class DistributedJobManager(JobManager):
             self._elastic_job.get_node_service_addr,
             self._elastic_job.get_node_name,
         )
+        # The managers of nodes which compute the model.
+        self._worker_mgrs = (
+            self._chief_manager,
+            self._worker_manager,
+            self._evaluator_manager,
+        )
+        for mgr in self._worker_mgrs + (self._ps_manager,):
+            mgr.set_node_added_callback(self._invalidate_all_nodes)
 
-    def add_node_event_callback(self, node_event_callback):
-        self._node_event_callbacks.append(node_event_callback)
+    def add_node_event_callback(self, node_event_callback: NodeEventCallback):
+        for status, name in _NODE_EVENT_CALLBACK_NAMES.items():
+            self._node_event_handlers[status].append(
+                getattr(node_event_callback, name)
+            )
 
     def _init_nodes(self):
         self._job_nodes = self._job_resource.init_job_node_meta(
@@ -280,6 +375,11 @@ class DistributedJobManager(JobManager):
             self._critical_worker_index,
         )
         update_nodes_priority(self._job_nodes)
+        self._invalidate_all_nodes()
+        self._pod_cache = {
+            (node.type, node.id): copy.copy(node)
+            for node in self._get_all_nodes()
+        }
 
         self._ps_manager.update_nodes(self._job_nodes.get(NodeType.PS, {}))
         chief_nodes = self._job_nodes.get(NodeType.CHIEF, {})
@@ -308,23 +408,123 @@ class DistributedJobManager(JobManager):
 
     def _monitor_nodes(self):
         logger.info("Start to monitor nodes")
+        backoff = _MIN_WATCH_BACKOFF_SECS
+        failure_time = 0.0
+        # The watcher which replays existing nodes as events starts with
+        # an empty version to skip the first list.
+        self._last_resource_version = self._node_watcher.get_resource_version()
         while True:
-            nodes = self._node_watcher.list()
-            self._process_list_nodes(nodes)
+            if self._last_resource_version is None:
+                self._list_nodes()
             try:
                 if self._stop_monitor:
                     logger.info("Stop processing node events")
                     break
-                for event in self._node_watcher.watch():
-                    try:
-                        self._process_event(event)
-                    except Exception as e:
-                        logger.warning(e)
-                        detail_trace_back = traceback.format_exc()
-                        logger.warning(detail_trace_back)
+                for event in self._node_watcher.watch(
+                    resource_version=self._last_resource_version
+                ):
+                    failure_time = self._log_watch_recovery(failure_time)
+                    backoff = _MIN_WATCH_BACKOFF_SECS
+                    self._last_resource_version = (
+                        self._node_watcher.get_resource_version()
+                    )
+                    self._update_pod_cache(event)
+                    self._dispatch_event(event)
+                # The watch has ended without errors.
+                failure_time = self._log_watch_recovery(failure_time)
+                backoff = _MIN_WATCH_BACKOFF_SECS
             except Exception as e:
-                logger.warning(e)
-                time.sleep(30)
+                if failure_time == 0:
+                    failure_time = time.time()
+                # Resume watching from the last version if it is not
+                # expired, otherwise list nodes again.
+                self._last_resource_version = (
+                    self._node_watcher.get_resource_version()
+                )
+                # Retry with exponential backoff and jitter to avoid
+                # missing events for a long time or flooding the apiserver.
+                delay = backoff + random.uniform(0, backoff / 2)
+                logger.warning(
+                    "Failed to watch nodes for %.3fs and retry after "
+                    "%.3fs: %s",
+                    time.time() - failure_time,
+                    delay,
+                    e,
+                )
+                # The wait returns at once if the manager stops.
+                self._stop_event.wait(delay)
+                backoff = min(backoff * 2, _MAX_WATCH_BACKOFF_SECS)
+
+    def _log_watch_recovery(self, failure_time: float) -> float:
+        """Log the seconds from the first failure to the recovery of the
+        node watch and return the reset failure time."""
+        if failure_time:
+            logger.info(
+                "Recovered watching nodes %.3fs after the failure.",
+                time.time() - failure_time,
+            )
+        return 0.0
+
+    def _list_nodes(self):
+        """List nodes to refresh the pod cache and get the resource version
+        from which to watch events if the watched version is expired.
+
+        The list uses the resource version "0" to be served from the watch
+        cache of the apiserver, which may be slightly stale compared with
+        a quorum read of etcd. It is acceptable because the watch started
+        from the returned version delivers all later changes. The cache
+        may return all Pods in one response ignoring the page limit.
+        """
+        nodes = self._node_watcher.list(resource_version="0")
+        self._last_resource_version = self._node_watcher.get_resource_version()
+        self._wait_dispatched_events()
+        self._process_list_nodes(nodes)
+        self._pod_cache = {(node.type, node.id): node for node in nodes}
+
+    def _dispatch_event(self, event: NodeEvent):
+        if self._stop_event.is_set():
+            return
+        index = hash((event.node.type, event.node.id)) % len(
+            self._event_executors
+        )
+        try:
+            self._event_executors[index].submit(
+                self._safe_process_event, event
+            )
+        except RuntimeError:
+            # The executors have been shut down by stop().
+            logger.info(
+                "Skip the event of %s after stopping.", event.node.name
+            )
+
+    def _wait_dispatched_events(self):
+        """Wait until the executors process all dispatched events. Then,
+        the events queued before a list cannot overwrite the listed nodes.
+        """
+        try:
+            futures = [
+                executor.submit(lambda: None)
+                for executor in self._event_executors
+            ]
+        except RuntimeError:
+            return
+        for future in futures:
+            future.result()
+
+    def _safe_process_event(self, event: NodeEvent):
+        try:
+            self._process_event(event)
+        except Exception as e:
+            logger.warning(e)
+            detail_trace_back = traceback.format_exc()
+            logger.warning(detail_trace_back)
+
+    def _update_pod_cache(self, event: NodeEvent):
+        key = (event.node.type, event.node.id)
+        if event.event_type == NodeEventType.DELETED:
+            self._pod_cache.pop(key, None)
+        else:
+            self._pod_cache[key] = event.node
 
     def _monitor_scale_plan_crd(self):
         """Monitor the Scaler CRD from users to adjust the job resource"""
@@ -347,44 +547,68 @@ class DistributedJobManager(JobManager):
                 logger.warning(e)
                 detail_trace_back = traceback.format_exc()
                 logger.warning(detail_trace_back)
-                time.sleep(5)
+                self._stop_event.wait(5)
 
     def _process_list_nodes(self, nodes: List[Node]):
-        """Callback with node list by the list api of k8s."""
+        """Callback with node list by the list api of k8s.
+
+        Only the nodes changed against the pod cache and the nodes deleted
+        without events are processed, all under one acquisition of the lock.
+        """
         if not nodes:
             return
-        exist_nodes: Dict[str, List[int]] = {}
+        exist_nodes: Dict[str, Set[int]] = {}
         for node_type in self._job_nodes.keys():
-            exist_nodes[node_type] = []
+            exist_nodes[node_type] = set()
+        changed_nodes: List[Node] = []
         for node in nodes:
-            exist_nodes[node.type].append(node.id)
-            if node.status == NodeStatus.DELETED:
-                type = NodeEventType.DELETED
-            else:
-                type = NodeEventType.MODIFIED
-            # Mock event to avoid missing events
-            event = NodeEvent(type, node)
-            self._process_event(event)
+            exist_nodes[node.type].add(node.id)
+            cached_node = self._pod_cache.get((node.type, node.id))
+            if (
+                cached_node is not None
+                and cached_node.status == node.status
+                and cached_node.exit_reason == node.exit_reason
+            ):
+                continue
+            changed_nodes.append(node)
+
+        relaunch_nodes: List[Node] = []
+        with self._lock_all_nodes():
+            for node in changed_nodes:
+                # Process the node as an event to avoid missing events.
+                if node.status == NodeStatus.DELETED:
+                    event_type = NodeEventType.DELETED
+                else:
+                    event_type = NodeEventType.MODIFIED
+                cur_node = self._update_node_info(node)
+                if cur_node and self._update_node_status(
+                    cur_node, node, event_type
+                ):
+                    relaunch_nodes.append(cur_node)
 
-        for node_type in self._job_nodes.keys():
-            #  Avoid dictionary keys changed during iteration
-            type_nodes = list(self._job_nodes[node_type].values())
-            for node in type_nodes:
+            # The cached list avoids dictionary changed during iteration.
+            for node in self._get_all_nodes():
                 if (
                     node.status != NodeStatus.INITIAL
                     and not node.is_released
-                    and node.id not in exist_nodes[node_type]
+                    and node.id not in exist_nodes[node.type]
                 ):
-                    logger.info(
-                        "Node %s %s is deleted without the event",
-                        node_type,
-                        node.id,
-                    )
+                    if logger.isEnabledFor(logging.INFO):
+                        self._log_node_info(
+                            "Node %s %s is deleted without the event",
+                            node.type,
+                            node.id,
+                        )
                     node.is_released = True
                     new_node = copy.deepcopy(node)
                     new_node.status = NodeStatus.DELETED
-                    event = NodeEvent(NodeEventType.DELETED, new_node)
-                    self._process_event(event)
+                    if self._update_node_status(
+                        node, new_node, NodeEventType.DELETED
+                    ):
+                        relaunch_nodes.append(node)
+
+        for node in relaunch_nodes:
+            self._relaunch_node(node)
 
     def close_job(self):
         plan = ScalePlan()
@@ -395,94 +619,207 @@ class DistributedJobManager(JobManager):
             "ps": ps_resource,
         }
         self._scaler.scale(plan=plan)
+        self._flush_node_logs()
         os._exit(0)
 
     def _process_event(self, event: NodeEvent):
-        node_type = event.node.type
-        node_id = event.node.id
-        if node_id not in self._job_nodes[node_type]:
-            logger.info(f"The node {event.node.name} is released.")
-            return
-        else:
-            cur_node = self._job_nodes[node_type][node_id]
-            cur_node.update_info(
-                name=event.node.name,
-                start_time=event.node.start_time,
-                create_time=event.node.create_time,
-                host_name=event.node.host_name,
-                host_ip=event.node.host_ip,
+        node = event.node
+        if node.update_time:
+            lag = time.time() - node.update_time
+            self._record_watch_event_lag(lag)
+            if lag > _MAX_WATCH_EVENT_LAG_SECS:
+                # The monitor thread caches the latest watched node before
+                # dispatching it, so a delayed event whose node is not
+                # cached any more has been superseded by a newer state.
+                cached_node = self._pod_cache.get((node.type, node.id))
+                if cached_node is not None and cached_node is not node:
+                    logger.warning(
+                        "Skip the event of node %s watched %.3fs ago "
+                        "which is superseded by a newer state.",
+                        node.name,
+                        lag,
+                    )
+                    return
+                logger.warning(
+                    "The event of node %s is processed %.3fs after watched.",
+                    node.name,
+                    lag,
+                )
+        self._apply_node(node, event.event_type)
+
+    def _record_watch_event_lag(self, lag: float):
+        with self._watch_event_lag_lock:
+            self._watch_event_count += 1
+            self._watch_event_lag_sum += lag
+            self._max_watch_event_lag = max(self._max_watch_event_lag, lag)
+
+    def _report_watch_event_lag(self):
+        """Log the mean and max lag of the node events processed since
+        the last report."""
+        with self._watch_event_lag_lock:
+            count = self._watch_event_count
+            lag_sum = self._watch_event_lag_sum
+            max_lag = self._max_watch_event_lag
+            self._watch_event_count = 0
+            self._watch_event_lag_sum = 0.0
+            self._max_watch_event_lag = 0.0
+        if count:
+            logger.info(
+                "Processed %d node events with the mean lag %.3fs and "
+                "the max lag %.3fs.",
+                count,
+                lag_sum / count,
+                max_lag,
             )
 
-        # For the given node id, check whether it meets
-        # the state change condition
-        if event.event_type == "exit":
-            self.close_job()
-        new_status = event.node.status
-        with self._lock:
-            old_status = cur_node.status
-            status_change_flow: NodeStateFlow = get_node_state_flow(
-                old_status, event.event_type, new_status
+    def _apply_node(self, node: Node, event_type):
+        """Apply the watched node with the event type to the node of
+        the job."""
+        with self._lock_for(node):
+            cur_node = self._update_node_info(node)
+            if cur_node is None:
+                return
+
+            # For the given node id, check whether it meets
+            # the state change condition
+            if event_type == "exit":
+                self.close_job()
+            should_relaunch = self._update_node_status(
+                cur_node, node, event_type
             )
-            # If there is no matched state change, return directly
-            # If the node has been succeed, return directly
+
+        if should_relaunch:
+            self._relaunch_node(cur_node)
+
+    def _get_all_nodes(self) -> List[Node]:
+        """Get all nodes of the job. The cached list is rebuilt after it
+        is invalidated by adding nodes."""
+        with self._all_nodes_lock:
+            if self._all_nodes is None:
+                # Copy the values because other threads may add nodes
+                # into the dicts during the iteration.
+                self._all_nodes = [
+                    node
+                    for nodes in list(self._job_nodes.values())
+                    for node in list(nodes.values())
+                ]
+            return self._all_nodes
+
+    def _invalidate_all_nodes(self):
+        with self._all_nodes_lock:
+            self._all_nodes = None
+
+    def _log_node_info(self, msg, *args):
+        self._node_logs.append((msg, args))
+        if len(self._node_logs) >= _MAX_BUFFERED_NODE_LOGS:
+            self._flush_node_logs()
+
+    def _flush_node_logs(self):
+        lines = []
+        while True:
+            try:
+                msg, args = self._node_logs.popleft()
+            except IndexError:
+                break
+            lines.append(msg % args)
+        if lines:
+            logger.info("\n".join(lines))
+
+    def _flush_node_logs_periodically(self):
+        last_report_time = time.time()
+        while not self._stop_event.wait(_NODE_LOG_FLUSH_INTERVAL):
+            self._flush_node_logs()
             if (
-                status_change_flow is None
-                or status_change_flow.from_status == NodeStatus.SUCCEEDED
+                time.time() - last_report_time
+                >= _WATCH_EVENT_LAG_REPORT_INTERVAL
             ):
-                return
+                self._report_watch_event_lag()
+                last_report_time = time.time()
+
+    def _lock_for(self, node: Node) -> threading.Lock:
+        index = hash((node.type, node.id)) % _NODE_LOCK_STRIPES
+        return self._node_locks[index]
+
+    @contextmanager
+    def _lock_all_nodes(self):
+        """Acquire the locks of all nodes in order to avoid deadlock."""
+        for lock in self._node_locks:
+            lock.acquire()
+        try:
+            yield
+        finally:
+            for lock in reversed(self._node_locks):
+                lock.release()
+
+    def _update_node_info(self, node: Node):
+        """Update the node of the job with the information of the watched
+        node. The caller must hold the lock of the node. Returns None if
+        the node has been released."""
+        cur_node = self._job_nodes[node.type].get(node.id)
+        if cur_node is None:
+            self._log_node_info("The node %s is released.", node.name)
+            return None
+        cur_node.update_info(
+            name=node.name,
+            start_time=node.start_time,
+            create_time=node.create_time,
+            host_name=node.host_name,
+            host_ip=node.host_ip,
+        )
+        return cur_node
+
+    def _update_node_status(self, cur_node: Node, node: Node, event_type):
+        """Transit the status of the node by the watched node with the
+        event type. The caller must hold the lock of the node. Returns
+        whether to relaunch the node."""
+        new_status = node.status
+        old_status = cur_node.status
+        status_change_flow: NodeStateFlow = get_node_state_flow(
+            old_status, event_type, new_status
+        )
+        # If there is no matched state change, return directly
+        # If the node has been succeed, return directly
+        if (
+            status_change_flow is None
+            or status_change_flow.from_status == NodeStatus.SUCCEEDED
+        ):
+            return False
 
-            # Update the node status
-            cur_node.update_status(new_status)
-            new_status = status_change_flow.to_status
-            cur_node.set_exit_reason(event.node.exit_reason)
+        # Update the node status
+        cur_node.update_status(new_status)
+        new_status = status_change_flow.to_status
+        cur_node.set_exit_reason(node.exit_reason)
+        with self._lock:
             self._process_node_events(status_change_flow, cur_node)
-
             should_relaunch = self._should_relaunch(
                 cur_node, status_change_flow
             )
             if should_relaunch and self._wait_pending_relaunch:
                 self._pending_relaunch_count += 1
 
-        logger.info(
-            "%s status change: %s to %s, by evt_type %s reason %s",
-            cur_node.name,
-            old_status,
-            new_status,
-            event.event_type,
-            cur_node.exit_reason,
-        )
-
-        if should_relaunch:
-            self._relaunch_node(cur_node)
+        # Skip building the arguments of the log if INFO is disabled.
+        if logger.isEnabledFor(logging.INFO):
+            self._log_node_info(
+                "%s status change: %s to %s, by evt_type %s reason %s",
+                cur_node.name,
+                old_status,
+                new_status,
+                event_type,
+                cur_node.exit_reason,
+            )
+        return should_relaunch
 
     def _process_node_events(
         self, status_change_flow: NodeStateFlow, node: Node
     ):
-        cluster_context = ClusterContext(job_manager=self)
-        if status_change_flow.to_status == NodeStatus.RUNNING:
-            [
-                callback.on_node_started(node, cluster_context)
-                for callback in self._node_event_callbacks
-            ]
-        elif status_change_flow.to_status == NodeStatus.SUCCEEDED:
-            [
-                callback.on_node_succeeded(node, cluster_context)
-                for callback in self._node_event_callbacks
-            ]
-        elif status_change_flow.to_status == NodeStatus.FAILED:
-            [
-                callback.on_node_failed(node, cluster_context)
-                for callback in self._node_event_callbacks
-            ]
-        elif (
-            status_change_flow.from_status != NodeStatus.FAILED
-            and status_change_flow.from_status != NodeStatus.SUCCEEDED
-            and status_change_flow.to_status == NodeStatus.DELETED
+        to_status = status_change_flow.to_status
+        if (
+            to_status == NodeStatus.DELETED
+            and status_change_flow.from_status in _EXITED_NODE_STATUS
         ):
-            [
-                callback.on_node_deleted(node, cluster_context)
-                for callback in self._node_event_callbacks
-            ]
+            return
+        for handler in self._node_event_handlers.get(to_status, ()):
+            handler(node, self._cluster_context)
 
     def _should_relaunch(self, node: Node, status_change_flow: NodeStateFlow):
         should_relaunch = (
@@ -491,12 +828,15 @@ class DistributedJobManager(JobManager):
             and node.relaunchable
         )
         if should_relaunch:
+            reason = node.exit_reason
+            relaunch_count = node.relaunch_count
+            max_relaunch_count = node.max_relaunch_count
             if (
-                node.exit_reason == NodeExitReason.FATAL_ERROR
+                reason == NodeExitReason.FATAL_ERROR
                 and not _dlrover_context.relaunch_always
             ):
                 should_relaunch = False
-            elif node.exit_reason == NodeExitReason.OOM:
+            elif reason == NodeExitReason.OOM:
                 mem = node.config_resource.memory
                 if mem >= NodeResourceLimit.MAX_MEMORY:
                     should_relaunch = False
@@ -505,21 +845,21 @@ class DistributedJobManager(JobManager):
                         mem,
                         NodeResourceLimit.MAX_MEMORY,
                     )
-                elif node.relaunch_count >= node.max_relaunch_count:
+                elif relaunch_count >= max_relaunch_count:
                     should_relaunch = False
                     logger.warning(
                         "The relaunched count %s is beyond the maximum %s.",
-                        node.relaunch_count,
-                        node.max_relaunch_count,
+                        relaunch_count,
+                        max_relaunch_count,
                     )
                 else:
                     node.is_recovered_oom = True
                     self._job_optimizer.adjust_oom_resource(node)
-            elif node.exit_reason != NodeExitReason.KILLED:
-                if node.relaunch_count >= node.max_relaunch_count:
+            elif reason != NodeExitReason.KILLED:
+                if relaunch_count >= max_relaunch_count:
                     logger.warning(
                         "The relaunch count "
-                        f"{node.relaunch_count}/{node.max_relaunch_count} "
+                        f"{relaunch_count}/{max_relaunch_count} "
                         "has been exhausted."
                     )
                     should_relaunch = False
@@ -529,50 +869,35 @@ class DistributedJobManager(JobManager):
         return should_relaunch
 
     def _relaunch_node(self, node: Node):
-        if node.type == NodeType.WORKER:
-            plan = self._worker_manager.relaunch_node(node)
-        elif node.type == NodeType.PS:
-            plan = self._ps_manager.relaunch_node(node)
-        elif node.type == NodeType.EVALUATOR:
-            plan = self._evaluator_manager.relaunch_node(node)
-        elif node.type == NodeType.CHIEF or node.type == NodeType.MASTER:
-            plan = self._chief_manager.relaunch_node(node)
-        else:
-            logger.error("Not support node type %s", node.type)
-        self._set_ps_addrs_in_plan(plan)
-        self._scaler.scale(plan)
+        with self._relaunch_lock:
+            if node.type == NodeType.WORKER:
+                plan = self._worker_manager.relaunch_node(node)
+            elif node.type == NodeType.PS:
+                plan = self._ps_manager.relaunch_node(node)
+            elif node.type == NodeType.EVALUATOR:
+                plan = self._evaluator_manager.relaunch_node(node)
+            elif node.type == NodeType.CHIEF or node.type == NodeType.MASTER:
+                plan = self._chief_manager.relaunch_node(node)
+            else:
+                logger.error("Not support node type %s", node.type)
+            self._set_ps_addrs_in_plan(plan)
+            self._scaler.scale(plan)
 
     def all_workers_exited(self):
-        return (
-            self._chief_manager.all_nodes_exited()
-            and self._worker_manager.all_nodes_exited()
-            and self._evaluator_manager.all_nodes_exited()
-        )
+        return all(mgr.all_nodes_exited() for mgr in self._worker_mgrs)
 
     def all_workers_failed(self):
-        return (
-            self._chief_manager.all_nodes_failed()
-            and self._worker_manager.all_nodes_failed()
-            and self._evaluator_manager.all_nodes_failed()
-        )
+        return all(mgr.all_nodes_failed() for mgr in self._worker_mgrs)
 
     def all_workers_deleted(self):
-        return (
-            self._chief_manager.all_nodes_deleted()
-            and self._worker_manager.all_nodes_deleted()
-            and self._evaluator_manager.all_nodes_deleted()
-        )
+        return all(mgr.all_nodes_deleted() for mgr in self._worker_mgrs)
 
     def all_critical_node_completed(self):
-        alive_critical_nodes = []
-        for _, nodes in self._job_nodes.items():
-            for node in nodes.values():
-                if node.critical and node.status in [
-                    NodeStatus.INITIAL,
-                    NodeStatus.PENDING,
-                    NodeStatus.RUNNING,
-                ]:
-                    alive_critical_nodes.append(node.name)
+        alive_critical_nodes = [
+            node.name
+            for node in self._get_all_nodes()
+            if node.critical and node.status in _ALIVE_NODE_STATUS
+        ]
 
         completed = not alive_critical_nodes
         if not completed:
@@ -589,11 +914,12 @@ class DistributedJobManager(JobManager):
             self._scaler.scale(plan)
 
     def get_running_nodes(self):
-        nodes = self._chief_manager.get_running_nodes()
-        nodes.extend(self._worker_manager.get_running_nodes())
-        nodes.extend(self._evaluator_manager.get_running_nodes())
-        nodes.extend(self._ps_manager.get_running_nodes())
-        return nodes
+        return list(
+            itertools.chain.from_iterable(
+                mgr.get_running_nodes()
+                for mgr in self._worker_mgrs + (self._ps_manager,)
+            )
+        )
 
     def get_running_workers(self):
         workers = self._worker_manager.get_running_nodes()
@@ -610,17 +936,20 @@ class DistributedJobManager(JobManager):
 
     def stop(self):
         self._enable_relaunch_node = False
-        with self._lock:
-            for node_type in self._job_nodes.keys():
-                for node in self._job_nodes[node_type].values():
-                    node.critical = False
-                    node.is_released = True
-                    node.relaunchable = False
+        with self._lock_all_nodes():
+            for node in self._get_all_nodes():
+                node.critical = False
+                node.is_released = True
+                node.relaunchable = False
             for node in self._job_nodes[NodeType.WORKER].values():
                 node.eval_time = self._speed_monitor.get_worker_eval_time(
                     node.id
                 )
         self._stop_monitor = True
+        self._stop_event.set()
+        for executor in self._event_executors:
+            executor.shutdown(wait=False)
+        self._flush_node_logs()
 
     def update_node_resource_usage(
         self, node_type, node_id, cpu, memory, gpu_stats=[]
@@ -742,8 +1071,9 @@ def create_job_manager(args: JobArgs, speed_monitor) -> DistributedJobManager:
     )
 
     elastic_job = new_elastic_job(args.platform, args.job_name, args.namespace)
+    stop_event = threading.Event()
     node_watcher = new_node_watcher(
-        args.platform, args.job_name, args.namespace
+        args.platform, args.job_name, args.namespace, stop_event
     )
     job_scaler = new_job_scaler(args.platform, args.job_name, args.namespace)
 
@@ -756,4 +1086,5 @@ def create_job_manager(args: JobArgs, speed_monitor) -> DistributedJobManager:
         node_watcher=node_watcher,
         job_scaler=job_scaler,
         error_monitor=ErrorLogMonitor(),
+        stop_event=stop_event,
     )
@@ -84,7 +84,7 @@ class ParameterServerManager(TrainingNodeManager):
         with self._lock:
             node.is_released = True
             new_id = next(self._node_id_iter)
-            self._nodes[new_id] = node.get_relaunch_node_info(new_id)
+            self._add_node(node.get_relaunch_node_info(new_id))
             if node in self._training_ps_cluster:
                 i = self._training_ps_cluster.index(node)
                 self._training_ps_cluster[i] = self._nodes[new_id]
@@ -144,7 +144,7 @@ class ParameterServerManager(TrainingNodeManager):
                     critical=True,
                     service_addr=service_addr,
                 )
-                self._nodes[ps_id] = ps
+                self._add_node(ps)
                 new_ps.append(ps)
                 logger.info("Create PS %s", ps)
         return new_ps
@@ -349,7 +349,7 @@ class ParameterServerManager(TrainingNodeManager):
                 service_addr=service_addr,
                 name=self._new_node_name_fn(NodeType.PS, new_ps_id),
             )
-            self._nodes[new_ps_id] = new_node
+            self._add_node(new_node)
             self._migrated_ps_nodes[old_ps_id] = new_node
             logger.info("Migrated PS %s to PS %s", old_ps_id, new_ps_id)
             return new_node
@@ -11,6 +11,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import itertools
 from collections import namedtuple
 
 from dlrover.python.common.constants import NodeStatus
@@ -119,7 +120,7 @@ NODE_STATE_FLOWS = [
 ]
 
 
-def get_node_state_flow(from_status, event_type, phase):
+def _find_node_state_flow(from_status, event_type, phase):
     if event_type == "DELETED" and from_status == NodeStatus.PENDING:
         # The phase if pending if the pending node is deleted.
         phase = NodeStatus.DELETED
@@ -134,3 +135,34 @@ def get_node_state_flow(from_status, event_type, phase):
             return flow
 
     return None
+
+
+def _build_node_state_flow_table():
+    statuses = [
+        value
+        for key, value in vars(NodeStatus).items()
+        if not key.startswith("_")
+    ]
+    event_types = set()
+    for flow in NODE_STATE_FLOWS:
+        event_types.update(flow.event_type)
+    table = {}
+    for key in itertools.product(statuses, event_types, statuses):
+        table[key] = _find_node_state_flow(*key)
+    return table
+
+
+# The flows of all known statuses and event types are precomputed
+# because the function is called for each node event.
+_NODE_STATE_FLOW_TABLE = _build_node_state_flow_table()
+
+_UNKNOWN_FLOW = object()
+
+
+def get_node_state_flow(from_status, event_type, phase):
+    flow = _NODE_STATE_FLOW_TABLE.get(
+        (from_status, event_type, phase), _UNKNOWN_FLOW
+    )
+    if flow is _UNKNOWN_FLOW:
+        return _find_node_state_flow(from_status, event_type, phase)
+    return flow
@@ -168,12 +168,22 @@ class TrainingNodeManager(object):
         self._lock = threading.Lock()
         self._node_id_iter = itertools.count(len(self._nodes))
         self._rank_id_iter = itertools.count(len(self._nodes))
+        self._node_added_callback = None
 
     def update_nodes(self, nodes):
         self._nodes = nodes
         self._node_id_iter = itertools.count(len(self._nodes))
         self._rank_id_iter = itertools.count(len(self._nodes))
 
+    def set_node_added_callback(self, callback):
+        """Set the callback to call after the manager adds a node."""
+        self._node_added_callback = callback
+
+    def _add_node(self, node: Node):
+        self._nodes[node.id] = node
+        if self._node_added_callback:
+            self._node_added_callback()
+
     def remove_node(self, node_id):
         plan = ScalePlan()
         if node_id not in self._nodes:
@@ -194,7 +204,7 @@ class TrainingNodeManager(object):
             node.is_released = True
             new_id = next(self._node_id_iter)
             relaunch_node = node.get_relaunch_node_info(new_id)
-            self._nodes[new_id] = relaunch_node
+            self._add_node(relaunch_node)
         logger.info("Relaunch node %s to %s", node.name, new_id)
         plan.launch_nodes.append(
             Node(
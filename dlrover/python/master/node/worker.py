@@ -165,7 +165,7 @@ class WorkerManager(TrainingNodeManager):
                 config_resource=copy.deepcopy(worker_resource),
                 service_addr=service_addr,
             )
-            self._nodes[worker_id] = new_node
+            self._add_node(new_node)
             logger.info("Create worker %s", self._nodes[worker_id])
             plan.launch_nodes.append(new_node)
         return plan
@@ -240,7 +240,7 @@ class WorkerManager(TrainingNodeManager):
                 rank_index=task_id,
                 name=self._new_node_name_fn(NodeType.WORKER, node_id),
             )
-            self._nodes[node_id] = new_node
+            self._add_node(new_node)
             plan.launch_nodes.append(new_node)
             plan.remove_nodes.append(old_node)
         return plan
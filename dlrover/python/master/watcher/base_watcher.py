@@ -30,11 +30,34 @@ class NodeWatcher(metaclass=ABCMeta):
         self._job_uuid = job_uuid
 
     @abstractmethod
-    def watch(self):
-        """Wath events of nodes and returns a generator"""
+    def watch(self, resource_version=None):
+        """Wath events of nodes and returns a generator. The generator
+        returns after the stop event of the watcher is set.
+
+        Args:
+            resource_version: the version after which to watch events.
+                The watcher resumes from its last version if it is None.
+                An empty string means to start from the latest state, in
+                which the platform sends the existing nodes as events.
+        """
         pass
 
     @abstractmethod
-    def list(self) -> List[Node]:
-        """List all nodes of the job"""
+    def list(self, resource_version=None) -> List[Node]:
+        """List all nodes of the job
+
+        Args:
+            resource_version: the version constraint of the list. "0"
+                allows to list nodes from the cache of the platform.
+        """
         pass
+
+    def get_resource_version(self):
+        """Get the resource version of the latest listed or watched nodes.
+        The caller can resume watching from the version without listing
+        all nodes again. An empty string means to watch from the latest
+        state, in which the watcher replays the existing nodes as events,
+        so the caller need not list nodes at first. None means that the
+        watcher has no valid version and the caller should list nodes.
+        """
+        return None
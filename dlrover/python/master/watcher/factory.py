@@ -15,16 +15,16 @@ from dlrover.python.common.constants import PlatformType
 from dlrover.python.common.log import default_logger as logger
 
 
-def new_node_watcher(platform, job_name, namespace):
+def new_node_watcher(platform, job_name, namespace, stop_event=None):
     logger.info("New %s NodeWatcher", platform)
     if platform in (PlatformType.KUBERNETES, PlatformType.PY_KUBERNETES):
         from dlrover.python.master.watcher.k8s_watcher import PodWatcher
 
-        return PodWatcher(job_name, namespace)
+        return PodWatcher(job_name, namespace, stop_event)
     elif platform in (PlatformType.RAY):
         from dlrover.python.master.watcher.ray_watcher import ActorWatcher
 
-        return ActorWatcher(job_name, namespace)
+        return ActorWatcher(job_name, namespace, stop_event)
     else:
         raise ValueError("Not support engine %s", platform)
 
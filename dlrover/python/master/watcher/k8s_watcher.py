@@ -11,9 +11,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
+import time
 from typing import List
 
-from kubernetes import watch
+from kubernetes import client, watch
 
 from dlrover.python.common.constants import (
     ElasticJobApi,
@@ -34,6 +36,13 @@ from dlrover.python.scheduler.kubernetes import (
     k8sClient,
 )
 
+_HTTP_STATUS_GONE = 410
+_LIST_PAGE_SIZE = 500
+_WATCH_TIMEOUT_SECS = 60
+# The read timeout of the watch request must be longer than the timeout
+# of the watch on the apiserver to not break an idle watch.
+_WATCH_REQUEST_TIMEOUT_SECS = 90
+
 
 def _get_start_timestamp(pod_status_obj):
     """Get the start timestamp of a Pod"""
@@ -88,11 +97,7 @@ def _convert_pod_event_to_node_event(event):
         # We only care about pod related events
         return None
 
-    # Skip events of dlrover mater Pod
     pod_type = evt_obj.metadata.labels[ElasticJobLabel.REPLICA_TYPE_KEY]
-    if pod_type == NodeType.DLROVER_MASTER:
-        return None
-
     rank = int(evt_obj.metadata.labels[ElasticJobLabel.RANK_INDEX_KEY])
     pod_id = int(evt_obj.metadata.labels[ElasticJobLabel.REPLICA_INDEX_KEY])
     pod_name = evt_obj.metadata.name
@@ -117,10 +122,27 @@ def _convert_pod_event_to_node_event(event):
     )
     node.create_time = evt_obj.metadata.creation_timestamp
     node.set_exit_reason(_get_pod_exit_reason(evt_obj))
+    node.update_time = time.time()
     node_event = NodeEvent(event_type=evt_type, node=node)
     return node_event
 
 
+def _convert_pod_to_node(pod):
+    labels = pod.metadata.labels
+    node = Node(
+        node_type=labels[ElasticJobLabel.REPLICA_TYPE_KEY],
+        node_id=int(labels[ElasticJobLabel.REPLICA_INDEX_KEY]),
+        name=pod.metadata.name,
+        rank_index=int(labels[ElasticJobLabel.RANK_INDEX_KEY]),
+        status=pod.status.phase,
+        start_time=_get_start_timestamp(pod.status),
+        config_resource=_parse_container_resource(pod.spec.containers[0]),
+    )
+    node.set_exit_reason(_get_pod_exit_reason(pod))
+    node.update_time = time.time()
+    return node
+
+
 def _parse_container_resource(container):
     cpu = convert_cpu_to_decimal(container.resources.requests["cpu"])
     memory = convert_memory_to_mb(container.resources.requests["memory"])
@@ -130,65 +152,88 @@ def _parse_container_resource(container):
 class PodWatcher(NodeWatcher):
     """PodWatcher monitors all Pods of a k8s Job."""
 
-    def __init__(self, job_name, namespace):
+    def __init__(self, job_name, namespace, stop_event=None):
         self._job_name = job_name
         self._namespace = namespace
         self._k8s_client = k8sClient.singleton_instance(namespace)
-        self._job_selector = ElasticJobLabel.JOB_KEY + "=" + self._job_name
+        self._stop_event: threading.Event = stop_event or threading.Event()
+        # Only select training Pods of the job on the apiserver and skip
+        # the dlrover master Pod.
+        self._job_selector = "{}={},{}!={}".format(
+            ElasticJobLabel.JOB_KEY,
+            self._job_name,
+            ElasticJobLabel.REPLICA_TYPE_KEY,
+            NodeType.DLROVER_MASTER,
+        )
+        # Watch from the latest state without a list at first.
+        self._resource_version = ""
 
-    def watch(self):
-        resource_version = None
-        pod_list = self._k8s_client.list_namespaced_pod(self._job_selector)
-        if pod_list:
-            resource_version = pod_list.metadata.resource_version
+    def watch(self, resource_version=None):
+        if resource_version is None:
+            resource_version = self._resource_version
+        if self._stop_event.is_set():
+            return
         try:
-            stream = watch.Watch().stream(
+            pod_watch = watch.Watch()
+            stream = pod_watch.stream(
                 self._k8s_client.client.list_namespaced_pod,
                 self._namespace,
                 label_selector=self._job_selector,
                 resource_version=resource_version,
-                timeout_seconds=60,
+                timeout_seconds=_WATCH_TIMEOUT_SECS,
+                _request_timeout=_WATCH_REQUEST_TIMEOUT_SECS,
             )
             for event in stream:
+                if self._stop_event.is_set():
+                    pod_watch.stop()
+                    return
+                evt_obj = event.get("object")
+                if evt_obj and evt_obj.metadata:
+                    self._resource_version = evt_obj.metadata.resource_version
                 node_event = _convert_pod_event_to_node_event(event)
                 if not node_event:
                     continue
                 yield node_event
+        except client.rest.ApiException as e:
+            if e.status == _HTTP_STATUS_GONE:
+                # The version is too old and the caller needs to list
+                # pods again to get the latest version.
+                self._resource_version = None
+            raise e
         except Exception as e:
             raise e
 
-    def list(self) -> List[Node]:
+    def get_resource_version(self):
+        return self._resource_version
+
+    def list(self, resource_version=None) -> List[Node]:
+        """List Pods page by page to avoid a huge response of the apiserver
+        and only keep the converted nodes of each page.
+
+        The pages only apply to the list without a resource version, which
+        is served by etcd. The apiserver may ignore the limit and return
+        all Pods in one response from its watch cache if the resource
+        version is "0".
+        """
         nodes: List[Node] = []
-        pod_list = self._k8s_client.list_namespaced_pod(self._job_selector)
-        if not pod_list:
-            return nodes
-        if not pod_list.items:
-            return nodes
-
-        replica_type_key = ElasticJobLabel.REPLICA_TYPE_KEY
-        replica_index_key = ElasticJobLabel.REPLICA_INDEX_KEY
-        rank_index_key = ElasticJobLabel.RANK_INDEX_KEY
-
-        for pod in pod_list.items:
-            pod_type = pod.metadata.labels[replica_type_key]
-            if pod_type == NodeType.DLROVER_MASTER:
-                continue
-            pod_id = int(pod.metadata.labels[replica_index_key])
-            task_id = int(pod.metadata.labels[rank_index_key])
-            resource = _parse_container_resource(pod.spec.containers[0])
-            status = pod.status.phase
-            start_time = _get_start_timestamp(pod.status)
-            node = Node(
-                node_type=pod_type,
-                node_id=pod_id,
-                name=pod.metadata.name,
-                rank_index=task_id,
-                status=status,
-                start_time=start_time,
-                config_resource=resource,
+        token = None
+        while True:
+            pod_list = self._k8s_client.list_namespaced_pod(
+                self._job_selector,
+                resource_version=resource_version,
+                limit=_LIST_PAGE_SIZE,
+                token=token,
             )
-            node.set_exit_reason(_get_pod_exit_reason(pod))
-            nodes.append(node)
+            if not pod_list:
+                # Return no nodes because the partial list may miss
+                # existing Pods.
+                return []
+            for pod in pod_list.items or []:
+                nodes.append(_convert_pod_to_node(pod))
+            token = pod_list.metadata._continue
+            if not token:
+                break
+        self._resource_version = pod_list.metadata.resource_version
         return nodes
 
 
@@ -11,6 +11,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import threading
 from typing import List
 
 from dlrover.python.common.constants import NodeType
@@ -20,6 +21,9 @@ from dlrover.python.master.watcher.base_watcher import NodeWatcher
 from dlrover.python.scheduler.ray import RayClient
 from dlrover.python.util.queue.queue import RayEventQueue
 
+# The seconds to wait for an event before checking the stop event.
+_EVENT_QUEUE_TIMEOUT_SECS = 1
+
 
 def check_actor_status(name):
     return "RUNNING"
@@ -80,20 +84,23 @@ class RayScalePlanWatcher:
 class ActorWatcher(NodeWatcher):
     """ActorWatcher monitors all actors of a ray Job."""
 
-    def __init__(self, job_name, namespace):
+    def __init__(self, job_name, namespace, stop_event=None):
         self._job_name = job_name
         self._namespace = namespace
         self._ray_client = RayClient.singleton_instance(job_name, namespace)
+        self._stop_event: threading.Event = stop_event or threading.Event()
         self.event_queue = RayEventQueue.singleton_instance()
 
-    def watch(self):
-        while True:
-            i = self.event_queue.get()
+    def watch(self, resource_version=None):
+        while not self._stop_event.is_set():
+            i = self.event_queue.get(timeout=_EVENT_QUEUE_TIMEOUT_SECS)
+            if i is None:
+                continue
             event = parse_event(i)
             logger.info(i)
             yield event
 
-    def list(self) -> List[Node]:
+    def list(self, resource_version=None) -> List[Node]:
         nodes: List[Node] = []
         for name, status in self._ray_client.list_actor():
             actor_type, actor_index = parse_type_id_from_actor_name(name)
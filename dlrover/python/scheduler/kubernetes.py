@@ -117,15 +117,31 @@ class k8sClient(object):
         self._namespace = namespace
 
     @retry_k8s_request
-    def list_namespaced_pod(self, label_selector):
+    def list_namespaced_pod(
+        self, label_selector, resource_version=None, limit=None, token=None
+    ):
         """List the pods in the namespace with the label selector.
 
         Args:
             label_selector: str like "label0=value0,lable1=value1"
+            resource_version: str, "0" means the apiserver can serve the
+                list from its watch cache instead of a quorum read of etcd.
+            limit: int, the maximum number of pods in the response.
+            token: str, the continue token in the metadata of the last
+                response to get the next page.
         """
+        kwargs = {}
+        if limit:
+            kwargs["limit"] = limit
+        if token:
+            kwargs["_continue"] = token
+        else:
+            # The apiserver rejects the resource version with a token.
+            kwargs["resource_version"] = resource_version
         pod_list = self.client.list_namespaced_pod(
             self._namespace,
             label_selector=label_selector,
+            **kwargs,
         )
         return pod_list
 
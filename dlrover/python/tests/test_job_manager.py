@@ -102,6 +102,9 @@ class NodeStatusFlowTest(unittest.TestCase):
         self.assertEqual(flow, NODE_STATE_FLOWS[9])
         self.assertTrue(flow.should_relaunch)
 
+        flow = get_node_state_flow(NodeStatus.RUNNING, "exit", "Evicted")
+        self.assertIsNone(flow)
+
 
 class DistributedJobManagerTest(unittest.TestCase):
     def setUp(self) -> None:
@@ -290,6 +293,257 @@ class DistributedJobManagerTest(unittest.TestCase):
         ps_ids = list(manager._job_nodes[NodeType.PS].keys())
         self.assertListEqual(ps_ids, [0, 1, 2, 3])
 
+    def test_process_list_nodes_with_pod_cache(self):
+        params = MockK8sPSJobArgs()
+        params.initilize()
+        manager = create_job_manager(params, SpeedMonitor())
+        manager._init_nodes()
+        nodes = []
+        for i in range(4):
+            node = Node(
+                node_type=NodeType.PS,
+                node_id=i,
+                status=NodeStatus.RUNNING,
+                config_resource=NodeResource(1, 4096),
+            )
+            nodes.append(node)
+            manager._pod_cache[(node.type, node.id)] = node
+        manager._process_list_nodes(nodes)
+        # The unchanged nodes in the cache are skipped.
+        for node in manager._job_nodes[NodeType.PS].values():
+            self.assertEqual(node.status, NodeStatus.INITIAL)
+
+        nodes[0] = Node(NodeType.PS, 0, status=NodeStatus.RUNNING)
+        manager._pod_cache[(NodeType.PS, 0)].status = NodeStatus.PENDING
+        manager._process_list_nodes(nodes)
+        ps_nodes = manager._job_nodes[NodeType.PS]
+        self.assertEqual(ps_nodes[0].status, NodeStatus.RUNNING)
+        self.assertEqual(ps_nodes[1].status, NodeStatus.INITIAL)
+
+    def test_dispatch_event(self):
+        params = MockK8sPSJobArgs()
+        params.initilize()
+        manager = create_job_manager(params, SpeedMonitor())
+        manager._init_nodes()
+        for status in [NodeStatus.PENDING, NodeStatus.RUNNING]:
+            node = Node(NodeType.WORKER, 1, status=status)
+            manager._dispatch_event(NodeEvent(NodeEventType.MODIFIED, node))
+        manager._wait_dispatched_events()
+        self.assertEqual(
+            manager._job_nodes[NodeType.WORKER][1].status, NodeStatus.RUNNING
+        )
+
+        # Skip events after the executors are shut down.
+        for executor in manager._event_executors:
+            executor.shutdown(wait=True)
+        node = Node(NodeType.WORKER, 1, status=NodeStatus.FAILED)
+        manager._dispatch_event(NodeEvent(NodeEventType.MODIFIED, node))
+        manager._wait_dispatched_events()
+        self.assertEqual(
+            manager._job_nodes[NodeType.WORKER][1].status, NodeStatus.RUNNING
+        )
+
+    def test_flush_node_logs(self):
+        params = MockK8sPSJobArgs()
+        params.initilize()
+        manager = create_job_manager(params, SpeedMonitor())
+        manager._log_node_info("The node %s is released.", "worker-0")
+        manager._log_node_info("The node %s is released.", "worker-1")
+        with mock.patch(
+            "dlrover.python.master.node.dist_job_manager.logger"
+        ) as mock_logger:
+            manager._flush_node_logs()
+            mock_logger.info.assert_called_once_with(
+                "The node worker-0 is released.\n"
+                "The node worker-1 is released."
+            )
+        self.assertEqual(len(manager._node_logs), 0)
+
+        # Flush logs before the master exits.
+        manager._log_node_info("The node %s is released.", "worker-0")
+        manager._scaler = mock.MagicMock()
+        with mock.patch(
+            "dlrover.python.master.node.dist_job_manager.os._exit"
+        ) as mock_exit:
+            manager.close_job()
+            mock_exit.assert_called_once_with(0)
+        self.assertEqual(len(manager._node_logs), 0)
+
+        # Flush a full buffer at once instead of dropping logs.
+        with mock.patch(
+            "dlrover.python.master.node.dist_job_manager"
+            "._MAX_BUFFERED_NODE_LOGS",
+            2,
+        ), mock.patch(
+            "dlrover.python.master.node.dist_job_manager.logger"
+        ) as mock_logger:
+            manager._log_node_info("The node %s is released.", "worker-0")
+            mock_logger.info.assert_not_called()
+            manager._log_node_info("The node %s is released.", "worker-1")
+            mock_logger.info.assert_called_once()
+        self.assertEqual(len(manager._node_logs), 0)
+
+    def test_update_node_status_without_info_log(self):
+        params = MockK8sPSJobArgs()
+        params.initilize()
+        manager = create_job_manager(params, SpeedMonitor())
+        manager._init_nodes()
+        cur_node = manager._job_nodes[NodeType.WORKER][0]
+        node = Node(NodeType.WORKER, 0, status=NodeStatus.RUNNING)
+        with mock.patch(
+            "dlrover.python.master.node.dist_job_manager.logger"
+        ) as mock_logger:
+            mock_logger.isEnabledFor.return_value = False
+            manager._update_node_status(cur_node, node, NodeEventType.MODIFIED)
+        self.assertEqual(cur_node.status, NodeStatus.RUNNING)
+        self.assertEqual(len(manager._node_logs), 0)
+
+    def test_get_all_nodes(self):
+        params = MockK8sPSJobArgs()
+        params.initilize()
+        manager = create_job_manager(params, SpeedMonitor())
+        manager._init_nodes()
+        all_nodes = manager._get_all_nodes()
+        self.assertEqual(len(all_nodes), 8)
+        self.assertIs(manager._get_all_nodes(), all_nodes)
+        worker = manager._job_nodes[NodeType.WORKER][0]
+        manager._worker_manager.relaunch_node(worker)
+        all_nodes = manager._get_all_nodes()
+        self.assertEqual(len(all_nodes), 9)
+        new_id = max(manager._job_nodes[NodeType.WORKER].keys())
+        self.assertIn(manager._job_nodes[NodeType.WORKER][new_id], all_nodes)
+
+    def test_monitor_nodes_with_backoff(self):
+        params = MockK8sPSJobArgs()
+        params.initilize()
+        manager = create_job_manager(params, SpeedMonitor())
+        manager._init_nodes()
+        watcher = mock.MagicMock()
+        watcher.list.return_value = []
+        watcher.get_resource_version.return_value = "1"
+        node = Node(NodeType.WORKER, 0, status=NodeStatus.RUNNING)
+
+        def _watch(resource_version=None):
+            if watcher.watch.call_count == 1:
+                raise ValueError("Mock watch failure")
+            manager._stop_monitor = True
+            yield NodeEvent(NodeEventType.MODIFIED, node)
+
+        watcher.watch.side_effect = _watch
+        manager._node_watcher = watcher
+        with mock.patch.object(
+            manager._stop_event, "wait"
+        ) as mock_wait, mock.patch(
+            "dlrover.python.master.node.dist_job_manager.logger"
+        ) as mock_logger:
+            manager._monitor_nodes()
+            backoff = mock_wait.call_args[0][0]
+            self.assertTrue(0.1 <= backoff <= 0.15)
+            mock_logger.warning.assert_called_once()
+            self.assertEqual(mock_logger.warning.call_args[0][2], backoff)
+            recovery_logs = [
+                args
+                for args, _ in mock_logger.info.call_args_list
+                if args[0].startswith("Recovered watching nodes")
+            ]
+            self.assertEqual(len(recovery_logs), 1)
+            self.assertGreaterEqual(recovery_logs[0][1], 0)
+        watcher.list.assert_not_called()
+
+        # List nodes again if the watched version is expired.
+        manager._stop_monitor = False
+        watcher.watch.reset_mock()
+        watcher.get_resource_version.side_effect = ["2", None, "3", "3"]
+        with mock.patch.object(manager._stop_event, "wait"):
+            manager._monitor_nodes()
+        watcher.list.assert_called_once_with(resource_version="0")
+
+        # List nodes at first if the watcher has no resource versions.
+        manager._stop_monitor = False
+        watcher.list.reset_mock()
+        watcher.get_resource_version.side_effect = None
+        watcher.get_resource_version.return_value = None
+
+        def _watch_after_list(resource_version=None):
+            self.assertTrue(watcher.list.called)
+            manager._stop_monitor = True
+            yield NodeEvent(NodeEventType.MODIFIED, node)
+
+        watcher.watch.side_effect = _watch_after_list
+        manager._monitor_nodes()
+        watcher.watch.assert_called()
+
+    def test_update_pod_cache(self):
+        params = MockK8sPSJobArgs()
+        params.initilize()
+        manager = create_job_manager(params, SpeedMonitor())
+        manager._init_nodes()
+        manager._list_nodes()
+        self.assertEqual(len(manager._pod_cache), 5)
+        self.assertEqual(manager._last_resource_version, "12345678")
+
+        node = Node(NodeType.WORKER, 3, status=NodeStatus.PENDING)
+        manager._update_pod_cache(NodeEvent(NodeEventType.MODIFIED, node))
+        self.assertEqual(manager._pod_cache[(NodeType.WORKER, 3)], node)
+        manager._update_pod_cache(NodeEvent(NodeEventType.DELETED, node))
+        self.assertNotIn((NodeType.WORKER, 3), manager._pod_cache)
+
+    def test_process_outdated_event(self):
+        params = MockK8sPSJobArgs()
+        params.initilize()
+        manager = create_job_manager(params, SpeedMonitor())
+        manager._init_nodes()
+        cur_node = manager._job_nodes[NodeType.WORKER][0]
+        node = Node(
+            NodeType.WORKER,
+            0,
+            status=NodeStatus.RUNNING,
+            host_ip="192.168.0.2",
+        )
+        node.update_time = time.time() - 20
+        newer_node = Node(NodeType.WORKER, 0, status=NodeStatus.SUCCEEDED)
+        manager._update_pod_cache(
+            NodeEvent(NodeEventType.MODIFIED, newer_node)
+        )
+        manager._process_event(NodeEvent(NodeEventType.MODIFIED, node))
+        self.assertEqual(cur_node.status, NodeStatus.INITIAL)
+        self.assertIsNone(cur_node.host_ip)
+        self.assertEqual(manager._watch_event_count, 1)
+        self.assertGreaterEqual(manager._max_watch_event_lag, 20)
+
+        # The delayed event is applied if it is the latest state.
+        manager._update_pod_cache(NodeEvent(NodeEventType.MODIFIED, node))
+        manager._process_event(NodeEvent(NodeEventType.MODIFIED, node))
+        self.assertEqual(cur_node.status, NodeStatus.RUNNING)
+        self.assertEqual(cur_node.host_ip, "192.168.0.2")
+
+    def test_report_watch_event_lag(self):
+        params = MockK8sPSJobArgs()
+        params.initilize()
+        manager = create_job_manager(params, SpeedMonitor())
+        manager._record_watch_event_lag(1.0)
+        manager._record_watch_event_lag(3.0)
+        with mock.patch(
+            "dlrover.python.master.node.dist_job_manager.logger"
+        ) as mock_logger:
+            manager._report_watch_event_lag()
+            args = mock_logger.info.call_args[0]
+            self.assertEqual(args[1:], (2, 2.0, 3.0))
+            mock_logger.info.reset_mock()
+            manager._report_watch_event_lag()
+            mock_logger.info.assert_not_called()
+        self.assertEqual(manager._max_watch_event_lag, 0.0)
+
+    def test_stop(self):
+        params = MockK8sPSJobArgs()
+        params.initilize()
+        manager = create_job_manager(params, SpeedMonitor())
+        manager._init_nodes()
+        manager.stop()
+        self.assertTrue(manager._stop_monitor)
+        self.assertTrue(manager._node_watcher._stop_event.is_set())
+        self.assertListEqual(list(manager._node_watcher.watch()), [])
+
     def test_create_allreduce_job_manager(self):
         params = MockK8sPSJobArgs()
         params.initilize()
@@ -347,6 +601,22 @@ class DistributedJobManagerTest(unittest.TestCase):
         self.assertEqual(len(dataset_0.doing), 0)
         self.assertEqual(len(dataset_1.doing), 0)
 
+    def test_serialize_node_event_callbacks(self):
+        params = MockK8sPSJobArgs()
+        params.initilize()
+        manager = create_job_manager(params, SpeedMonitor())
+        manager._init_nodes()
+        callback = mock.MagicMock()
+        callback.on_node_started.side_effect = (
+            lambda node, context: self.assertTrue(manager._lock.locked())
+        )
+        manager.add_node_event_callback(callback)
+        cur_node = manager._job_nodes[NodeType.WORKER][0]
+        node = Node(NodeType.WORKER, 0, status=NodeStatus.RUNNING)
+        manager._update_node_status(cur_node, node, NodeEventType.MODIFIED)
+        callback.on_node_started.assert_called_once()
+        self.assertFalse(manager._lock.locked())
+
     def test_create_initial_nodes(self):
         params = MockK8sPSJobArgs()
         params.initilize()
@@ -394,6 +664,22 @@ class DistributedJobManagerTest(unittest.TestCase):
         manager._job_nodes[NodeType.WORKER][0].status = NodeStatus.FINISHED
         self.assertTrue(manager.all_critical_node_completed())
 
+    def test_get_running_nodes(self):
+        params = MockK8sPSJobArgs()
+        params.initilize()
+        manager = create_job_manager(params, SpeedMonitor())
+        manager._init_nodes()
+        self.assertEqual(manager.get_running_nodes(), [])
+
+        manager._job_nodes[NodeType.CHIEF][0].status = NodeStatus.RUNNING
+        manager._job_nodes[NodeType.WORKER][0].status = NodeStatus.RUNNING
+        manager._job_nodes[NodeType.PS][0].status = NodeStatus.RUNNING
+        running_nodes = manager.get_running_nodes()
+        self.assertEqual(
+            sorted(node.type for node in running_nodes),
+            sorted([NodeType.CHIEF, NodeType.WORKER, NodeType.PS]),
+        )
+
     def test_tf_ps_node_handling(self):
         params = MockK8sPSJobArgs()
         params.initilize()
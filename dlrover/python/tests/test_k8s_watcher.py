@@ -12,8 +12,10 @@
 # limitations under the License.
 
 import datetime
+import threading
 import unittest
 from typing import List
+from unittest import mock
 
 from kubernetes import client
 
@@ -36,6 +38,7 @@ from dlrover.python.tests.test_utils import (
     create_pod,
     get_test_scale_plan,
     mock_k8s_client,
+    mock_list_namespaced_pod,
 )
 
 
@@ -46,8 +49,14 @@ class PodWatcherTest(unittest.TestCase):
     def test_list(self):
         mock_k8s_client()
         pod_watcher = PodWatcher("test", "")
+        self.assertEqual(
+            pod_watcher._job_selector,
+            "elasticjob.dlrover/name=test,"
+            "elasticjob.dlrover/replica-type!=dlrover-master",
+        )
         nodes: List[Node] = pod_watcher.list()
         self.assertEqual(len(nodes), 5)
+        self.assertEqual(pod_watcher.get_resource_version(), "12345678")
         node: Node = nodes[0]
         self.assertEqual(node.id, 0)
         self.assertEqual(node.type, NodeType.PS)
@@ -63,6 +72,60 @@ class PodWatcherTest(unittest.TestCase):
         self.assertEqual(node.type, NodeType.WORKER)
         self.assertEqual(node.status, NodeStatus.RUNNING)
 
+    def test_list_with_pages(self):
+        pod_watcher = PodWatcher("test", "")
+        pod_list = mock_list_namespaced_pod("")
+        first_page = client.V1PodList(
+            items=pod_list.items[:3],
+            metadata=client.V1ListMeta(
+                resource_version="12345678", _continue="token"
+            ),
+        )
+        last_page = client.V1PodList(
+            items=pod_list.items[3:],
+            metadata=client.V1ListMeta(resource_version="12345678"),
+        )
+        list_pod = mock.MagicMock(side_effect=[first_page, last_page])
+        pod_watcher._k8s_client.list_namespaced_pod = list_pod
+        nodes: List[Node] = pod_watcher.list()
+        self.assertEqual(len(nodes), 5)
+        self.assertEqual(list_pod.call_count, 2)
+        first_kwargs = list_pod.call_args_list[0][1]
+        self.assertIsNone(first_kwargs["resource_version"])
+        self.assertEqual(first_kwargs["limit"], 500)
+        self.assertIsNone(first_kwargs["token"])
+        self.assertEqual(list_pod.call_args[1]["token"], "token")
+        self.assertEqual(pod_watcher.get_resource_version(), "12345678")
+
+        # The watch cache may return all Pods in one response.
+        list_pod = mock.MagicMock(return_value=pod_list)
+        pod_watcher._k8s_client.list_namespaced_pod = list_pod
+        nodes = pod_watcher.list(resource_version="0")
+        self.assertEqual(len(nodes), 5)
+        list_pod.assert_called_once()
+
+        # Do not return a partial list if a page fails.
+        list_pod = mock.MagicMock(side_effect=[first_page, None])
+        pod_watcher._k8s_client.list_namespaced_pod = list_pod
+        self.assertListEqual(pod_watcher.list(), [])
+
+    def test_watch_with_stop_event(self):
+        stop_event = threading.Event()
+        pod_watcher = PodWatcher("test", "", stop_event)
+        pods = mock_list_namespaced_pod("").items
+        events = [{"object": pod, "type": "MODIFIED"} for pod in pods]
+        with mock.patch(
+            "dlrover.python.master.watcher.k8s_watcher.watch.Watch"
+        ) as mock_watch:
+            mock_watch.return_value.stream.return_value = iter(events)
+            for node_event in pod_watcher.watch():
+                stop_event.set()
+            self.assertEqual(node_event.node.id, 0)
+            mock_watch.return_value.stop.assert_called_once()
+            mock_watch.reset_mock()
+            self.assertListEqual(list(pod_watcher.watch()), [])
+            mock_watch.assert_not_called()
+
     def test_convert_pod_event_to_node_event(self):
         labels = {
             ElasticJobLabel.APP_NAME: "test",
@@ -11,6 +11,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import unittest
 
 from dlrover.python.common.constants import (
@@ -204,3 +205,13 @@ class PodScalerTest(unittest.TestCase):
             scaler._create_node_queue[0].service_addr,
             "elasticjob-sample-edljob-worker-1.default.svc:3333",
         )
+
+    def test_scale_plan_to_json(self):
+        scale_plan = ScalePlan()
+        scale_plan.launch_nodes.append(
+            Node(NodeType.WORKER, 1, NodeResource(4, 8192), name="worker-1")
+        )
+        plan = json.loads(scale_plan.to_json())
+        node = plan["launch_nodes"][0]
+        self.assertEqual(node["name"], "worker-1")
+        self.assertEqual(node["config_resource"]["memory"], 8192)
@@ -0,0 +1,25 @@
+# Copyright 2023 The DLRover Authors. All rights reserved.
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from dlrover.python.util.queue.queue import ConcurrentQueue
+
+
+class ConcurrentQueueTest(unittest.TestCase):
+    def test_get_with_timeout(self):
+        queue = ConcurrentQueue(capacity=10)
+        self.assertIsNone(queue.get(timeout=0.01))
+        queue.put(1)
+        self.assertEqual(queue.get(timeout=0.01), 1)
+        self.assertEqual(queue.size(), 0)
@@ -189,7 +189,9 @@ def create_pod(labels):
     return pod
 
 
-def mock_list_namespaced_pod(label_selector):
+def mock_list_namespaced_pod(
+    label_selector, resource_version=None, limit=None, token=None
+):
     pods = []
     for i in range(2):
         labels = {
@@ -24,12 +24,14 @@ class ConcurrentQueue:
         self.__cond = threading.Condition(self.__mutex)
         self.__queue = queue.Queue()
 
-    def get(self):
+    def get(self, timeout=None):
+        """Get an element from the queue. Returns None if the queue is
+        still empty after the timeout seconds."""
+        elem = None
         if self.__cond.acquire():
-            while self.__queue.empty():
-                self.__cond.wait()
-            elem = self.__queue.get()
-            self.__cond.notify()
+            if self.__cond.wait_for(lambda: not self.__queue.empty(), timeout):
+                elem = self.__queue.get()
+                self.__cond.notify()
             self.__cond.release()
         return elem
 
@@ -75,9 +77,10 @@ class RayEventQueue:
         logger.info("putting {} into ray event queue".format(value))
         return self.queue.put(value)
 
-    def get(self):
-        value = self.queue.get()
-        logger.info("getting {} into ray event queue".format(value))
+    def get(self, timeout=None):
+        value = self.queue.get(timeout)
+        if value is not None:
+            logger.info("getting {} into ray event queue".format(value))
         return value
 
     def size(self):